@@ -0,0 +1,420 @@
+import hashlib
+import json
+import logging
+import os
+import sys
+import time
+from datetime import datetime, timezone
+
+import requests
+
+
+class DropChangeDetector:
+    """Compare `HowRareIs.get_drops` results against the previous snapshot.
+
+    Each drop is indexed by a hashed key built from its project name, so the
+    comparison is a single pass over both snapshots. A second hash of the
+    tracked fields tells us whether a known drop has changed.
+    """
+
+    _TRACKED_FIELDS = [
+        "date",
+        "time_est",
+        "time_utc",
+        "twitter_url",
+        "discord_url",
+        "website_url",
+        "supply",
+        "mint_price",
+    ]
+
+    def __init__(self, snapshot_filename):
+        self._log = logging.getLogger(__name__)
+        self._snapshot_filename = snapshot_filename
+
+    def _hash(self, values):
+        return hashlib.sha1(json.dumps(values, default=str).encode("utf-8")).hexdigest()
+
+    def _normalize(self, value):
+        if value is None:
+            return ""
+        return str(value).strip().lower()
+
+    def _drop_key(self, record, name_count):
+        name = self._normalize(record["project_name"])
+
+        # Drops without a name have nothing stable to identify them by, so they
+        # are keyed on their whole content instead.
+        if not name:
+            return self._hash(
+                [self._normalize(record.get(field)) for field in self._TRACKED_FIELDS]
+            )
+
+        # A project listed on several dates (e.g. presale and public mint)
+        # needs the date to tell its listings apart.
+        if name_count[name] > 1:
+            return self._hash([name, self._normalize(record["date"])])
+
+        return self._hash([name])
+
+    def _index_drops(self, drops):
+        """Flatten the date-indexed drops into {key: drop} with hashed keys."""
+        records = []
+        name_count = {}
+        for date in drops:
+            for drop in drops[date]:
+                record = {"date": date}
+                record.update(drop)
+                record["fingerprint"] = self._hash(
+                    [record.get(field) for field in self._TRACKED_FIELDS]
+                )
+                records.append(record)
+
+                name = self._normalize(record["project_name"])
+                name_count[name] = name_count.get(name, 0) + 1
+
+        indexed = {}
+        for record in records:
+            key = self._drop_key(record, name_count)
+
+            # Same name listed twice on the same date: fall back to the content
+            if key in indexed:
+                key = self._hash([key, record["fingerprint"]])
+
+            if key in indexed:
+                self._log.debug(
+                    "Skipping identical drop for change detection: %s",
+                    record["project_name"],
+                )
+                continue
+
+            indexed[key] = record
+
+        return indexed
+
+    def _find_previous(self, key, drop, previous, matched):
+        """Find the previous listing of `drop`.
+
+        A project gains or loses the date in its key when it starts or stops
+        being listed on several dates, so a listing on the same date under the
+        other form of the key is the same drop.
+        """
+        if key in previous and key not in matched:
+            return key
+
+        name = self._normalize(drop["project_name"])
+        if not name:
+            return None
+
+        date = self._normalize(drop["date"])
+        for other in [self._hash([name]), self._hash([name, date])]:
+            if (
+                other in previous
+                and other not in matched
+                and previous[other]["date"] == drop["date"]
+            ):
+                return other
+
+        return None
+
+    def _date_has_passed(self, date):
+        """True if `date` (formatted as %m/%d) is before today."""
+        today = datetime.now(timezone.utc).date()
+        try:
+            mint_date = datetime.strptime(f"{today.year}/{date}", "%Y/%m/%d").date()
+        except (TypeError, ValueError):
+            return False
+
+        # Listings only span a few months, so a date more than half a year
+        # away really belongs to the neighbouring year.
+        days_until = (mint_date - today).days
+        if days_until > 182:
+            return True
+        if days_until < -182:
+            return False
+
+        return days_until < 0
+
+    def _load_snapshot(self):
+        if not os.path.isfile(self._snapshot_filename):
+            return None
+
+        try:
+            with open(self._snapshot_filename, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except ValueError as e:
+            self._log.warning(
+                "Unable to read snapshot %s: %s. Starting over.",
+                self._snapshot_filename,
+                repr(e),
+            )
+            return None
+
+    def save_snapshot(self, indexed):
+        """Store `indexed` as the snapshot the next run is compared against.
+
+        Call this only once the events returned alongside it were delivered.
+        """
+        with open(self._snapshot_filename, "w", encoding="utf-8") as f:
+            json.dump(indexed, f, default=str)
+
+    def _make_event(self, event_type, key, drop, changes=None):
+        return {
+            "type": event_type,
+            "key": key,
+            "project_name": drop["project_name"],
+            "date": drop["date"],
+            "fingerprint": drop["fingerprint"],
+            "changes": changes or {},
+            "detected_at": datetime.now(timezone.utc).isoformat(),
+        }
+
+    def detect_changes(self, drops):
+        """Diff `drops` against the previous snapshot.
+
+        The snapshot is not updated; pass the returned index to
+        `save_snapshot` once the events have been delivered. When `drops` is
+        empty the index is None and the old snapshot should be kept. When
+        there is no previous snapshot, no events are reported and the index
+        only serves as a baseline. Drops whose mint date has passed fall off
+        the listing every day, so they are not reported as removed.
+
+        @return A tuple of (events, index).
+        @example
+        ```python
+            (
+                [
+                    {
+                        "type": "new" | "removed" | "changed",
+                        "key": str,
+                        "project_name": str,
+                        "date": str,
+                        "fingerprint": str,
+                        "changes": {"time_utc": [old, new], ...},
+                        "detected_at": str,
+                    },
+                    ...
+                ],
+                {key: drop, ...},
+            )
+        ```
+        """
+        current = self._index_drops(drops)
+        if len(current) == 0:
+            self._log.warning(
+                "No drops found. Skipping change detection and keeping the last snapshot."
+            )
+            return [], None
+
+        previous = self._load_snapshot()
+        if previous is None:
+            self._log.info(
+                "No previous snapshot found at %s. Using this scrape as the baseline.",
+                self._snapshot_filename,
+            )
+            return [], current
+
+        events = []
+        matched = set()
+
+        for key, drop in current.items():
+            previous_key = self._find_previous(key, drop, previous, matched)
+            if previous_key is None:
+                events.append(self._make_event("new", key, drop))
+                continue
+
+            matched.add(previous_key)
+            old = previous[previous_key]
+            if old.get("fingerprint") != drop["fingerprint"]:
+                changes = {
+                    field: [old.get(field), drop.get(field)]
+                    for field in self._TRACKED_FIELDS
+                    if old.get(field) != drop.get(field)
+                }
+                events.append(self._make_event("changed", key, drop, changes))
+
+        for key, drop in previous.items():
+            if key not in matched and not self._date_has_passed(drop["date"]):
+                events.append(self._make_event("removed", key, drop))
+
+        self._log.info(
+            "Detected %s change%s since the last scrape.",
+            len(events),
+            "" if len(events) == 1 else "s",
+        )
+
+        return events, current
+
+
+class StdoutSink:
+    def __init__(self, stream=None):
+        self._stream = stream if stream is not None else sys.stdout
+
+    def send(self, events):
+        for event in events:
+            changes = ", ".join(
+                f"{field}: {old} -> {new}"
+                for field, (old, new) in event["changes"].items()
+            )
+            self._stream.write(
+                "[{}] {} ({}){}\n".format(
+                    event["type"].upper(),
+                    event["project_name"],
+                    event["date"],
+                    f" {changes}" if changes else "",
+                )
+            )
+        self._stream.flush()
+
+
+class JsonlFileSink:
+    def __init__(self, filename):
+        self._filename = filename
+
+    def send(self, events):
+        with open(self._filename, "a", encoding="utf-8") as f:
+            for event in events:
+                f.write(json.dumps(event, default=str) + "\n")
+
+
+class WebhookSink:
+    def __init__(self, url, timeout=10):
+        self._url = url
+        self._timeout = timeout
+
+    def send(self, events):
+        r = requests.post(self._url, json={"events": events}, timeout=self._timeout)
+
+        if r.status_code >= 300:
+            raise RuntimeError(
+                f"Unable to deliver alerts to {self._url} (Status: {r.status_code})"
+            )
+
+
+class AlertDispatcher:
+    """Deliver change events to a list of sinks in batches.
+
+    Alerts are debounced across runs: an event that repeats a state already
+    delivered for the same drop within `debounce_seconds` is suppressed, so a
+    value flipping back and forth between scrapes alerts once per window.
+    Delivered alerts are remembered in `history_filename`.
+    """
+
+    def __init__(
+        self, sinks, batch_size=50, debounce_seconds=0, history_filename=None
+    ):
+        if len(sinks) == 0:
+            raise ValueError("At least one alert sink is required")
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be at least 1 (got {batch_size})")
+        if debounce_seconds < 0:
+            raise ValueError(
+                f"debounce_seconds must not be negative (got {debounce_seconds})"
+            )
+        if debounce_seconds > 0 and not history_filename:
+            raise ValueError("history_filename is required to debounce alerts")
+
+        self._log = logging.getLogger(__name__)
+        self._sinks = sinks
+        self._batch_size = batch_size
+        self._debounce_seconds = debounce_seconds
+        self._history_filename = history_filename
+
+        self._pending = []
+        self._history = None
+
+    def _history_key(self, event):
+        return "{}:{}:{}".format(event["key"], event["type"], event["fingerprint"])
+
+    def _load_history(self):
+        if self._history is not None:
+            return self._history
+
+        self._history = {}
+        if os.path.isfile(self._history_filename):
+            try:
+                with open(self._history_filename, "r", encoding="utf-8") as f:
+                    self._history = json.load(f)
+            except ValueError as e:
+                self._log.warning(
+                    "Unable to read alert history %s: %s. Starting over.",
+                    self._history_filename,
+                    repr(e),
+                )
+
+        # Forget alerts that are outside the debounce window
+        cutoff = time.time() - self._debounce_seconds
+        self._history = {
+            key: sent_at for key, sent_at in self._history.items() if sent_at >= cutoff
+        }
+        return self._history
+
+    def _save_history(self, events):
+        history = self._load_history()
+        now = time.time()
+        for event in events:
+            history[self._history_key(event)] = now
+
+        with open(self._history_filename, "w", encoding="utf-8") as f:
+            json.dump(history, f)
+
+    def emit(self, events):
+        if self._debounce_seconds > 0:
+            history = self._load_history()
+            fresh = [e for e in events if self._history_key(e) not in history]
+            if len(fresh) < len(events):
+                self._log.info(
+                    "Suppressed %s repeated alert%s.",
+                    len(events) - len(fresh),
+                    "" if len(events) - len(fresh) == 1 else "s",
+                )
+            events = fresh
+
+        self._pending.extend(events)
+
+    def flush(self):
+        """Send all pending events.
+
+        @return True if every sink accepted every batch.
+        """
+        events = self._pending
+        self._pending = []
+
+        delivered = True
+        for start in range(0, len(events), self._batch_size):
+            batch = events[start : start + self._batch_size]
+            for sink in self._sinks:
+                try:
+                    sink.send(batch)
+                except Exception as e:
+                    delivered = False
+                    self._log.error(
+                        "Unable to send %s alert%s to %s: %s",
+                        len(batch),
+                        "" if len(batch) == 1 else "s",
+                        type(sink).__name__,
+                        repr(e),
+                    )
+
+        if delivered and self._debounce_seconds > 0 and len(events) > 0:
+            self._save_history(events)
+
+        return delivered
+
+
+if __name__ == "__main__":
+    from how_rare_is_connector import HowRareIs
+
+    logging.basicConfig(level=logging.DEBUG)
+
+    detector = DropChangeDetector("drops_snapshot.json")
+    dispatcher = AlertDispatcher([StdoutSink()])
+
+    started = time.monotonic()
+    events, snapshot = detector.detect_changes(HowRareIs().get_drops())
+    dispatcher.emit(events)
+    if dispatcher.flush() and snapshot is not None:
+        detector.save_snapshot(snapshot)
+    logging.getLogger(__name__).info(
+        "Alerts sent in %.2f seconds.", time.monotonic() - started
+    )
@@ -3,6 +3,13 @@ from configparser import ConfigParser
 import openpyxl
 from openpyxl.styles import Alignment, PatternFill, Font, DEFAULT_FONT
 from how_rare_is_connector import HowRareIs
+from drop_changes import (
+    AlertDispatcher,
+    DropChangeDetector,
+    JsonlFileSink,
+    StdoutSink,
+    WebhookSink,
+)
 from openpyxl.utils import get_column_letter
 import os
 
@@ -24,11 +31,16 @@ class UpcomingDrops:
         warning_subtitle,
         add_sheets_for_days,
         html_file_name=None,
+        change_detector=None,
+        alert_dispatcher=None,
     ):
         self._filename = filename
         self._html_file_name = html_file_name
         self._drops = HowRareIs(self._html_file_name)
 
+        self._change_detector = change_detector
+        self._alert_dispatcher = alert_dispatcher
+
         self._add_sheets_for_days = add_sheets_for_days
 
         self._drops_written = 0
@@ -63,6 +75,41 @@ class UpcomingDrops:
             "Warning Subtitle".ljust(30, "."),
             self._warning_subtitle,
         )
+        self._log.info(
+            "%s%s %s",
+            " " * 4,
+            "Change Alerts".ljust(30, "."),
+            self._alerts_enabled,
+        )
+
+    @property
+    def _alerts_enabled(self):
+        return self._change_detector != None and self._alert_dispatcher != None
+
+    def _alert_changes(self, drops):
+        if not self._alerts_enabled:
+            return
+
+        self._log.info("Checking for changes since the last scrape...")
+        try:
+            events, snapshot = self._change_detector.detect_changes(drops)
+
+            # Send alerts now rather than waiting for the workbook to be built
+            self._alert_dispatcher.emit(events)
+            delivered = self._alert_dispatcher.flush()
+
+            if snapshot is None:
+                return
+
+            if delivered:
+                self._change_detector.save_snapshot(snapshot)
+            else:
+                self._log.error(
+                    "Some alerts were not delivered. "
+                    "Keeping the last snapshot so they are reported again next time."
+                )
+        except Exception as e:
+            self._log.error("Unable to check for changes: %s", repr(e))
 
     def _save_workbook(self, workbook, filename):
         while True:
@@ -283,6 +330,7 @@ class UpcomingDrops:
 
         self._log.info("Acquiring drops...")
         drops = self._drops.get_drops()
+        self._alert_changes(drops)
         self._log.info("Creating Excel document ...")
         self._log.info(
             "Printing %s of %s days.",
@@ -324,10 +372,72 @@ def get_default_config():
     }
 
 
+def get_default_alert_config():
+    """Options for the optional [change_alerts] section. It is written to new
+    configuration files but is not required by verify_config."""
+    return {
+        "change_alerts": {
+            "enabled": "False",
+            "stdout": "True",
+            "jsonl_filename": "",
+            "webhook_url": "",
+            "snapshot_filename": "drops_snapshot.json",
+            "batch_size": "50",
+            "debounce_seconds": "3600",
+            "history_filename": "drops_alert_history.json",
+        }
+    }
+
+
+def get_alert_pipeline(config: ConfigParser):
+    """Build the change detector and alert dispatcher from the optional
+    [change_alerts] section. Returns (None, None) when alerts are disabled."""
+    section = "change_alerts"
+    defaults = get_default_alert_config()[section]
+
+    if not config.getboolean(section, "enabled", fallback=False):
+        return None, None
+
+    sinks = []
+    if config.getboolean(section, "stdout", fallback=True):
+        sinks.append(StdoutSink())
+
+    jsonl_filename = config.get(section, "jsonl_filename", fallback="")
+    if jsonl_filename:
+        sinks.append(JsonlFileSink(jsonl_filename))
+
+    webhook_url = config.get(section, "webhook_url", fallback="")
+    if webhook_url:
+        sinks.append(WebhookSink(webhook_url))
+
+    detector = DropChangeDetector(
+        config.get(
+            section, "snapshot_filename", fallback=defaults["snapshot_filename"]
+        )
+    )
+    dispatcher = AlertDispatcher(
+        sinks,
+        batch_size=config.getint(
+            section, "batch_size", fallback=int(defaults["batch_size"])
+        ),
+        debounce_seconds=config.getfloat(
+            section,
+            "debounce_seconds",
+            fallback=float(defaults["debounce_seconds"]),
+        ),
+        history_filename=config.get(
+            section, "history_filename", fallback=defaults["history_filename"]
+        ),
+    )
+
+    return detector, dispatcher
+
+
 def create_default_config(filename):
     if not os.path.isfile(filename):
         config = ConfigParser()
         default_config = get_default_config()
+        default_config.update(get_default_alert_config())
 
         for key in default_config:
             config.add_section(key)
@@ -402,12 +512,20 @@ if __name__ == "__main__":
             else None
         )
 
+        try:
+            change_detector, alert_dispatcher = get_alert_pipeline(config)
+        except ValueError as e:
+            logging.error("Change alerts disabled: %s", repr(e))
+            change_detector, alert_dispatcher = None, None
+
         um = UpcomingDrops(
             filename,
             warning_title,
             warning_subtitle,
             add_sheets_for_days,
             html_file_name,
+            change_detector,
+            alert_dispatcher,
         )
 
         um.create_excel(days)